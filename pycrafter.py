@@ -13,31 +13,114 @@ license : MIT License
 
 # IMPORTS
 import os
+import re
 import sys
-import shutil
-import tempfile
+import stat
+import atexit
+import queue
+import asyncio
 import threading
-import platform
-import subprocess
-import webbrowser
-import tempfile
 import logging
+import types
+import functools
+import itertools
+import hashlib
+import importlib.util
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Iterable
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import ttk
 from tkinter.font import Font
 
 
-# Handle PyInstaller import
-try:
-    import PyInstaller.__main__
-    from PyInstaller import log as pyi_log
+# Characters not allowed in executable names
+_INVALID_NAME_CHARS: str = '<>:"/\\|?*'
+_INVALID_NAME_RE = re.compile(f"[{re.escape(_INVALID_NAME_CHARS)}]")
+
+# Separator between source and destination of --add-data/--add-binary entries,
+# either ';' (Windows) or ':' (POSIX) but never a drive letter colon such as 'C:\'
+_SPEC_SPLIT_RE = re.compile(r';|:(?![\\/])')
+
+# A frozen PyCrafter has no interpreter of its own to run PyInstaller with,
+# sys.executable is then the GUI itself and the PyInstaller console script is used instead
+_FROZEN: bool = getattr(sys, "frozen", False)
+_PYINSTALLER_CMD: tuple[str, ...] = ("pyinstaller",) if _FROZEN else (sys.executable, "-m", "PyInstaller")
+
+# Build output lines kept in the building dialog log
+_LOG_MAX_LINES: int = 1000
+
+# Persistent PyInstaller process used by the GUI, it imports PyInstaller once and then
+# runs one build per JSON request read from stdin, ending each with a DONE marker line
+_PYINSTALLER_DAEMON_SRC: str = """
+import json, os, sys, traceback
+import PyInstaller.__main__
+
+requests, sys.stdin = sys.stdin, open(os.devnull)
+# Each build changes directory, relative requests resolve against the launch directory
+launch_dir = os.getcwd()
+for line in requests:
+    request = json.loads(line)
+    try:
+        os.chdir(os.path.join(launch_dir, request["cwd"]))
+        PyInstaller.__main__.run(request["args"])
+        rc = 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            rc = e.code or 0
+        else:
+            # PyInstaller reports most user errors as a SystemExit message
+            print(e.code, flush=True)
+            rc = 1
+    except Exception:
+        traceback.print_exc()
+        rc = 1
+    print("DONE:", rc, flush=True)
+"""
 
-    PYINSTALLER_AVAILABLE: bool = True
 
-except ImportError:
-    PYINSTALLER_AVAILABLE: bool = False
+@functools.lru_cache(maxsize=None)
+def _pyinstaller_available() -> bool:
+    """Check for PyInstaller without importing it, builds run in a separate process"""
+    if _FROZEN:
+        import shutil
+        return shutil.which(_PYINSTALLER_CMD[0]) is not None
+    return importlib.util.find_spec("PyInstaller") is not None
+
+
+# Spec file templates rendered by Crafter
+_SPEC_TEMPLATE: str = """# -*- mode: python ; coding: utf-8 -*-
+# Generated by PyCrafter, manual changes will be overwritten
+
+
+a = Analysis(
+    [{script!r}],
+    pathex={pathex!r},
+    binaries={binaries!r},
+    datas={datas!r},
+    hiddenimports={hiddenimports!r},
+    hookspath=[],
+    runtime_hooks=[],
+    excludes={excludes!r},{optimize}
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,{bundle}
+    name={name!r},
+    console={console!r},
+    icon={icon!r},
+    uac_admin={uac_admin!r},
+)
+{collect}"""
+
+_COLLECT_TEMPLATE: str = """coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    name={name!r},
+)
+"""
 
 
 class CrafterError(Exception):
@@ -64,13 +147,16 @@ class Const:
 
     github_repo: str = "https://github.com/aymenbrahimdjelloul/PyCrafter"
 
+    # Declare build cache location
+    cache_dir: Path = Path.home() / ".pycrafter_cache"
+
     # Declare UI constants
     geometry: str = "430x600"
     caption: str = f"PyCrafter - v{version}"
 
     # Declare colors constants
     emoji_icon: str = "🔨"
-    colors: dict[str, str] = {
+    colors: types.MappingProxyType = types.MappingProxyType({
         "primary": "#3498db",
         "primary_dark": "#2980b9",
         "primary_darker": "#21618c",
@@ -82,7 +168,124 @@ class Const:
         "background_alt": "#f8f9fa",
         "background_section": "#ecf0f1",
         "shadow": "#e3e8f0"
-    }
+    })
+
+
+# Frequently used colors bound once at module level
+_PRIMARY: str = Const.colors["primary"]
+_SECONDARY: str = Const.colors["secondary"]
+_TEXT: str = Const.colors["text"]
+_TEXT_LIGHTER: str = Const.colors["text_lighter"]
+_BG: str = Const.colors["background"]
+_BG_ALT: str = Const.colors["background_alt"]
+_BG_SECTION: str = Const.colors["background_section"]
+_LINK: str = Const.colors.get("link", "#0066CC")
+
+
+# PyInstaller options built by the GUI, mapped from its field values
+_BOOL_FLAGS: tuple[tuple[str, str], ...] = (
+    ("one_file", "--onefile"),
+    ("no_console", "--noconsole"),
+    ("admin", "--uac-admin"),
+    ("clean_build", "--clean"),
+    ("force_replace", "--noconfirm")
+)
+
+_KV_FLAGS: tuple[tuple[str, str], ...] = (
+    ("output", "--distpath"),
+    ("icon", "--icon"),
+    ("name", "--name")
+)
+
+_REPEATED_FLAGS: tuple[tuple[str, str, str], ...] = (
+    ("hidden_imports", "--hidden-import", ""),
+    ("excluded_modules", "--exclude-module", ""),
+    ("data_files", "--add-data", ";."),
+    ("binary_files", "--add-binary", ";."),
+    ("extra_paths", "--paths", "")
+)
+
+
+def _artifact_path(output: Path, name: str, one_file: bool) -> Path:
+    """Get the executable (onefile) or folder (onedir) PyInstaller produces in output"""
+    if one_file:
+        return output / (f"{name}.exe" if sys.platform.startswith("win") else name)
+    return output / name
+
+
+def _needs_noconfirm(force_replace: bool, one_file: bool) -> bool:
+    """Check whether a build must pass --noconfirm to PyInstaller"""
+    # PyInstaller refuses to replace an existing onedir folder when its output is piped
+    return force_replace or not one_file
+
+
+def _pyinstaller_env(optimize: bool) -> Optional[dict]:
+    """Get the environment of a PyInstaller process, optimizing through the interpreter flag"""
+    return {**os.environ, "PYTHONOPTIMIZE": "2"} if optimize else None
+
+
+def _cache_dir_for(kind: str, *parts: str) -> Path:
+    """Get a persistent directory of the PyCrafter cache keyed by the given strings"""
+    key = hashlib.blake2b("\x00".join(parts).encode(), digest_size=8).hexdigest()
+    return Const.cache_dir / kind / key
+
+
+def _hash_file_tree(h: hashlib.blake2b, path: Path) -> None:
+    """Feed the names and contents of a file, or of every file under a directory, into a hash"""
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    for file in files:
+        h.update(str(file).encode())
+        h.update(file.read_bytes())
+
+
+def _installed_packages() -> List[str]:
+    """Get the name and version of every package installed in the environment"""
+    from importlib import metadata
+
+    return sorted(f"{dist.metadata['Name']}=={dist.version}" for dist in metadata.distributions())
+
+
+def _hash_build_inputs(h: hashlib.blake2b, script_dir: Path, sources: Iterable[Path], icon: Optional[Path]) -> None:
+    """Feed everything a build reads besides its configuration into a hash"""
+    # Local modules and packages next to the script that it may import
+    for entry in sorted(script_dir.iterdir()):
+        if entry.suffix == ".py" and entry.is_file():
+            _hash_file_tree(h, entry)
+        elif (entry / "__init__.py").is_file():
+            for source in sorted(entry.rglob("*.py")):
+                _hash_file_tree(h, source)
+
+    # Bundled data and binary files
+    for source in sources:
+        if source.exists():
+            _hash_file_tree(h, source)
+
+    # The icon path is part of the configuration, its content has to be hashed too
+    if icon is not None and icon.is_file():
+        _hash_file_tree(h, icon)
+
+    h.update("\n".join(_installed_packages()).encode())
+
+
+def _center_on(widget: tk.Misc, width: int, height: int) -> str:
+    """Get the geometry placing a width x height window over the center of widget"""
+    # A single winfo_geometry round-trip instead of separate position and size queries
+    pw, ph, px, py = map(int, re.findall(r"-?\d+", widget.winfo_geometry()))
+    return f"{width}x{height}+{px + (pw - width) // 2}+{py + (ph - height) // 2}"
+
+
+def _open_with(opener: str) -> Callable[[str], None]:
+    """Get a function opening a path with the given file manager command"""
+    def open_folder(path: str) -> None:
+        import subprocess
+        subprocess.Popen([opener, path])
+    return open_folder
+
+
+# Open a folder in the platform file manager, chosen once at import
+_OPEN_FOLDER: Callable[[str], None] = (os.startfile if sys.platform.startswith("win")
+                                       else _open_with("open") if sys.platform == "darwin"
+                                       else _open_with("xdg-open"))
 
 
 class Crafter:
@@ -91,13 +294,32 @@ class Crafter:
     Designed for backend use with PyCraft GUI or standalone automation.
     """
 
+    # Attributes that invalidate the cached build information when reassigned
+    _BUILD_FIELDS: frozenset[str] = frozenset({
+        "script", "output", "icon", "name", "one_file", "no_console", "require_admin",
+        "optimize", "hidden_imports", "excluded_modules", "data_files",
+        "binary_files", "extra_paths"
+    })
+
+    # List attributes stored as tuples, so in-place edits cannot bypass the build information cache
+    _LIST_FIELDS: frozenset[str] = frozenset({
+        "hidden_imports", "excluded_modules", "data_files", "binary_files", "extra_paths"
+    })
+
+    # Cached file system checks invalidated when the related path attribute is reassigned
+    _PATH_CACHES: dict[str, tuple[str, ...]] = {
+        "script": ("_script_stat",),
+        "icon": ("_icon_stat",),
+        "output": ("_output_writable",)
+    }
+
     def __init__(self,
                  script: str,
                  output: Optional[str] = None,
                  icon: Optional[str] = None,
                  name: Optional[str] = None,
                  no_console: bool = False,
-                 one_file: bool = True,
+                 one_file: bool = False,
                  require_admin: bool = False,
                  clean_build: bool = False,
                  force_replace: bool = False,
@@ -110,19 +332,21 @@ class Crafter:
                  progress_callback: Optional[Callable[[str], None]] = None) -> None:
 
         # Initialize presence of PyInstaller
-        if not PYINSTALLER_AVAILABLE:
+        if not _pyinstaller_available():
             raise CrafterError("PyInstaller is not installed. Install it using: pip install pyinstaller")
 
         # Check for empty script path
         if not script or not isinstance(script, str):
             raise CrafterError("Script path must be a non-empty string")
 
-        # Check the python script
+        # Check the python script, its stat result is kept for later checks
         script_path = Path(script)
-        if not script_path.is_file() or script_path.suffix.lower() != ".py":
+        script_stat = self._stat(script_path)
+        if script_stat is None or not stat.S_ISREG(script_stat.st_mode) or script_path.suffix.lower() != ".py":
             raise CrafterError("The provided script path must point to a valid .py file.")
 
         self.script = script_path.resolve()
+        self._script_stat = script_stat
         self.output = Path(output).resolve() if output else self.script.parent
         self.icon = Path(icon).resolve() if icon else None
         self.name = name or self.script.stem
@@ -134,16 +358,21 @@ class Crafter:
         self.optimize = optimize
         self.progress_callback = progress_callback
 
-        # Ensure lists are not None and filter out empty strings
-        self.hidden_imports = [item.strip() for item in (hidden_imports or []) if item and item.strip()]
-        self.excluded_modules = [item.strip() for item in (excluded_modules or []) if item and item.strip()]
-        self.data_files = [item.strip() for item in (data_files or []) if item and item.strip()]
-        self.binary_files = [item.strip() for item in (binary_files or []) if item and item.strip()]
-        self.extra_paths = [item.strip() for item in (extra_paths or []) if item and item.strip()]
+        # Lists are cleaned into tuples on assignment, see __setattr__
+        self.hidden_imports = hidden_imports
+        self.excluded_modules = excluded_modules
+        self.data_files = data_files
+        self.binary_files = binary_files
+        self.extra_paths = extra_paths
 
         # Setup logging
         self._setup_logging()
 
+    @staticmethod
+    def _clean_list(items: Optional[List[str]]) -> tuple[str, ...]:
+        """Strip every item once and drop the empty and duplicate ones, keeping the order"""
+        return tuple(dict.fromkeys(item for item in (item.strip() for item in items or () if item) if item))
+
     def _setup_logging(self) -> None:
         """Setup logging configuration"""
         logging.basicConfig(
@@ -157,11 +386,13 @@ class Crafter:
         Build the executable with comprehensive error handling
 
         Returns:
-            str: Path to the created executable
+            str: Path to the created executable, or its folder for onedir builds
 
         Raises:
             CrafterError: If build fails or validation errors occur
         """
+        import subprocess
+
         try:
             self._log_progress("Starting build process...")
 
@@ -175,37 +406,101 @@ class Crafter:
             # Ensure output directory exists
             self.output.mkdir(parents=True, exist_ok=True)
 
-            exe_path = self.output / f"{self.name}.exe"
-            if self.force_replace and exe_path.exists():
+            artifact = self._exe_path()
+            if self.force_replace and artifact.exists():
                 self._log_progress("Removing existing executable...")
-                exe_path.unlink()
+                self._remove_path(artifact)
+
+            # Reuse a previous build when neither the script nor its inputs changed
+            cached_artifact = self._build_cache_dir() / self._cache_key() / artifact.name
+            if not self.clean_build and cached_artifact.exists():
+                self._log_progress("Inputs unchanged, restoring executable from build cache...")
+                # Replace the whole artifact, merging into an older onedir folder would keep stale files
+                if artifact.exists():
+                    self._remove_path(artifact)
+                self._copy_path(cached_artifact, artifact)
+                self._log_progress(f"✅ Build complete! Executable created at: {artifact}")
+                return str(artifact)
 
             self._log_progress("Preparing PyInstaller command...")
 
             cmd = self._build_command()
 
-            pyi_log.logger.setLevel(pyi_log.INFO)
-
             self._log_progress(f"Building {self.name} from {self.script}...")
+            self.logger.info(f"Script size: {self._script_stat.st_size / 1024:.2f} KB")
             self.logger.info(f"PyInstaller command: {' '.join(cmd)}")
 
-            # Run PyInstaller
-            PyInstaller.__main__.run(cmd)
+            # Run PyInstaller in a separate process to keep its memory out of this one
+            process = subprocess.Popen([*_PYINSTALLER_CMD, *cmd],
+                                       stdin=subprocess.DEVNULL,
+                                       stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT,
+                                       text=True)
+
+            for line in process.stdout:
+                self._log_progress(line.rstrip())
+
+            return_code = process.wait()
+            if return_code != 0:
+                raise CrafterError(f"PyInstaller exited with code {return_code}")
 
             # Verify the executable was created
-            if exe_path.exists():
-                self._log_progress(f"✅ Build complete! Executable created at: {exe_path}")
-                self.logger.info(f"Executable size: {exe_path.stat().st_size / (1024 * 1024):.2f} MB")
-                return str(exe_path)
+            if artifact.exists():
+                self._store_in_cache(artifact, cached_artifact)
+                self._log_progress(f"✅ Build complete! Executable created at: {artifact}")
+                if self.one_file:
+                    self.logger.info(f"Executable size: {artifact.stat().st_size / (1024 * 1024):.2f} MB")
+                return str(artifact)
             else:
                 raise CrafterError("Build completed but executable file was not found.")
 
         except Exception as e:
             error_msg = f"Build failed: {str(e)}"
             self._log_progress(f"❌ {error_msg}")
-            self.logger.error(error_msg, exc_info=self.debug)
+            self.logger.error(error_msg, exc_info=True)
             raise CrafterError(error_msg) from e
 
+    @classmethod
+    def build_many(cls, configs: List[dict], workers: int = 0) -> List[str]:
+        """
+        Build several scripts concurrently
+
+        Args:
+            configs: Keyword arguments of each Crafter to build
+            workers: Number of concurrent builds, defaults to the CPU count
+
+        Returns:
+            List[str]: Paths to the created executables, in the order of configs
+
+        Raises:
+            CrafterError: If any build fails, once every build has finished
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        # Builds run in PyInstaller child processes, threads are enough to drive them
+        workers = workers or os.cpu_count() or 1
+        crafters = [cls(**config) for config in configs]
+
+        results: List[Optional[str]] = [None] * len(crafters)
+        errors = []
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(crafter.build): index for index, crafter in enumerate(crafters)}
+
+            for done, future in enumerate(as_completed(futures), start=1):
+                crafter = crafters[futures[future]]
+                try:
+                    results[futures[future]] = future.result()
+                except CrafterError as e:
+                    errors.append(f"{crafter.script}: {e}")
+
+                crafter.logger.info(f"Finished {done}/{len(crafters)} builds")
+
+        if errors:
+            raise CrafterError("Some builds failed:\n" + "\n".join(errors))
+
+        return results
+
     def _log_progress(self, message: str):
         """Log progress to both callback and logger"""
         if self.progress_callback:
@@ -214,114 +509,261 @@ class Crafter:
 
     def _validate_inputs(self):
         """Validate all input parameters"""
-        if not self.script.exists():
+        if self._script_stat is None:
             raise CrafterError(f"Script file not found: {self.script}")
 
-        if self.icon and not self.icon.exists():
+        if self.icon and self._icon_stat is None:
             raise CrafterError(f"Icon file not found: {self.icon}")
 
-        if not os.access(self.output.parent, os.W_OK):
+        if not self._output_writable:
             raise CrafterError(f"No write permission for output directory: {self.output}")
 
         # Validate name doesn't contain invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        if any(char in self.name for char in invalid_chars):
-            raise CrafterError(f"Executable name contains invalid characters: {invalid_chars}")
-
-        # Validate data files and binaries exist
-        for data_file in self.data_files:
-            if ';' in data_file:
-                src_path = data_file.split(';')[0]
-                if not Path(src_path).exists():
-                    raise CrafterError(f"Data file not found: {src_path}")
-
-        for binary_file in self.binary_files:
-            if ';' in binary_file:
-                src_path = binary_file.split(';')[0]
-                if not Path(src_path).exists():
-                    raise CrafterError(f"Binary file not found: {src_path}")
+        if _INVALID_NAME_RE.search(self.name):
+            raise CrafterError(f"Executable name contains invalid characters: {_INVALID_NAME_CHARS}")
+
+        # Validate data files and binaries exist, scanning each parent directory once
+        sources_by_parent: dict[Path, list[tuple[str, Path]]] = {}
+        for kind, specs in (("Data file", self.data_files), ("Binary file", self.binary_files)):
+            for spec in specs:
+                src_path = Path(self._split_spec(spec)[0])
+                sources_by_parent.setdefault(src_path.parent, []).append((kind, src_path))
+
+        missing = []
+        for parent, sources in sources_by_parent.items():
+            try:
+                with os.scandir(parent) as entries:
+                    names = {os.path.normcase(entry.name) for entry in entries}
+            except OSError:
+                names = set()
+
+            missing.extend(f"{kind} not found: {src_path}" for kind, src_path in sources
+                           if os.path.normcase(src_path.name) not in names)
+
+        if missing:
+            raise CrafterError("\n".join(missing))
 
     def _build_command(self) -> List[str]:
-        """Build the PyInstaller command with all parameters"""
-        # Create temporary directories for this build
-        work_dir = Path(tempfile.mkdtemp(prefix="pyinstaller_work_"))
-        spec_dir = Path(tempfile.mkdtemp(prefix="pyinstaller_spec_"))
+        """Build the PyInstaller command running the generated spec file"""
+        # Reuse a stable per-script work directory so PyInstaller can rebuild incrementally
+        work_dir = self._work_dir()
+        work_dir.mkdir(parents=True, exist_ok=True)
 
         cmd = [
-            str(self.script),
-            "--name", self.name,
+            str(self._write_spec_file()),
             "--distpath", str(self.output),
-            "--workpath", str(work_dir),
-            "--specpath", str(spec_dir)
+            "--workpath", str(work_dir)
         ]
 
-        if self.icon:
-            cmd.extend(["--icon", str(self.icon)])
+        if _needs_noconfirm(self.force_replace, self.one_file):
+            cmd.append("--noconfirm")
 
-        if self.one_file:
-            cmd.append("--onefile")
+        return cmd
 
-        if self.no_console:
-            cmd.append("--noconsole")
+    def _write_spec_file(self) -> Path:
+        """Render the spec file into the work directory, rewriting it only when its content changed"""
+        # Kept out of the script folder so a hand-written <script>.spec is never overwritten
+        spec_file = self._work_dir() / f"{self.name}.spec"
+        content = self._render_spec()
 
-        if self.require_admin:
-            cmd.append("--uac-admin")
+        try:
+            if spec_file.read_text(encoding="utf-8") == content:
+                return spec_file
+        except OSError:
+            pass
+
+        spec_file.write_text(content, encoding="utf-8")
+        return spec_file
+
+    def _render_spec(self) -> str:
+        """Render the PyInstaller spec file content from the build configuration"""
+        info = self.build_info
+        name = info["executable_name"]
+
+        if info["one_file"]:
+            bundle = "\n    a.binaries,\n    a.datas,\n    [],"
+            collect = ""
+        else:
+            bundle = "\n    [],\n    exclude_binaries=True,"
+            collect = _COLLECT_TEMPLATE.format(name=name)
+
+        return _SPEC_TEMPLATE.format(
+            script=info["script"],
+            pathex=[str(Path(path).resolve()) for path in info["extra_paths"]],
+            binaries=[self._resolve_spec(spec) for spec in info["binary_files"]],
+            datas=[self._resolve_spec(spec) for spec in info["data_files"]],
+            hiddenimports=list(info["hidden_imports"]),
+            excludes=list(info["excluded_modules"]),
+            optimize="\n    optimize=2," if info["optimize"] else "",
+            bundle=bundle,
+            name=name,
+            console=not info["no_console"],
+            icon=info["icon"],
+            uac_admin=info["require_admin"],
+            collect=collect
+        )
 
-        if self.optimize:
-            cmd.extend(["--optimize", "2"])
+    @staticmethod
+    def _split_spec(spec: str) -> tuple[str, str]:
+        """Split a 'source;destination' entry, defaulting to the bundle root"""
+        parts = _SPEC_SPLIT_RE.split(spec, maxsplit=1)
+        return parts[0], parts[1] if len(parts) > 1 else "."
 
-        # Add hidden imports
-        for item in self.hidden_imports:
-            cmd.extend(["--hidden-import", item])
+    def _resolve_spec(self, spec: str) -> tuple[str, str]:
+        """Split an entry and make its source path absolute for the spec file"""
+        src, dest = self._split_spec(spec)
+        return str(Path(src).resolve()), dest
 
-        # Add excluded modules
-        for item in self.excluded_modules:
-            cmd.extend(["--exclude-module", item])
+    def _exe_path(self) -> Path:
+        """Get the executable (onefile) or folder (onedir) produced by PyInstaller"""
+        return _artifact_path(self.output, self.name, self.one_file)
 
-        # Add data files
-        for data in self.data_files:
-            cmd.extend(["--add-data", data])
+    def _cache_key(self) -> str:
+        """Hash the build configuration and every input the build reads into a cache key"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(sorted(self.build_info.items())).encode())
 
-        # Add binary files
-        for binary in self.binary_files:
-            cmd.extend(["--add-binary", binary])
+        # Same inputs as the GUI builds, the script itself is one of the local modules
+        _hash_build_inputs(digest, self.script.parent,
+                           (Path(self._split_spec(spec)[0]) for spec in self.data_files + self.binary_files),
+                           self.icon)
 
-        # Add extra paths
-        for path in self.extra_paths:
-            cmd.extend(["--paths", path])
+        return digest.hexdigest()
 
-        return cmd
+    def _store_in_cache(self, artifact: Path, cached_artifact: Path) -> None:
+        """Copy a freshly built artifact into the build cache, evicting older builds of this script"""
+        import shutil
+
+        try:
+            entry = cached_artifact.parent
+            if entry.parent.exists():
+                for stale in entry.parent.iterdir():
+                    if stale != entry:
+                        shutil.rmtree(stale, ignore_errors=True)
+
+            if cached_artifact.exists():
+                self._remove_path(cached_artifact)
+            entry.mkdir(parents=True, exist_ok=True)
+            self._copy_path(artifact, cached_artifact)
+
+        except OSError as e:
+            self.logger.warning(f"Could not store build in cache: {e}")
+
+    @staticmethod
+    def _copy_path(src: Path, dst: Path) -> None:
+        """Copy a file or a directory tree"""
+        import shutil
+
+        if src.is_dir():
+            shutil.copytree(src, dst, dirs_exist_ok=True)
+        else:
+            shutil.copy2(src, dst)
+
+    @staticmethod
+    def _remove_path(path: Path) -> None:
+        """Remove a file or a directory tree"""
+        import shutil
+
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+
+    def _build_cache_dir(self) -> Path:
+        """Get the build cache directory for this script, it only keeps the latest build"""
+        return _cache_dir_for("builds", str(self.script), self.name)
+
+    def _work_dir(self) -> Path:
+        """Get the persistent PyInstaller work directory for this script"""
+        return _cache_dir_for("work", str(self.script), self.name)
 
     def _clean_temp_files(self):
         """Clean temporary build and spec files."""
+        import shutil
+
         try:
-            # Clean spec file
-            spec_file = self.script.with_suffix(".spec")
-            if spec_file.exists():
-                spec_file.unlink()
-                self.logger.debug(f"Removed spec file: {spec_file}")
-
-            # Clean build directories
-            for folder_name in ["build", "__pycache__"]:
-                folder_path = self.script.parent / folder_name
+            # Clean persistent work directory, along with the generated spec file
+            work_dir = self._work_dir()
+            if work_dir.exists():
+                shutil.rmtree(work_dir, ignore_errors=True)
+                self.logger.debug(f"Removed directory: {work_dir}")
+
+            # Clean this script's build directories, shared caches are left untouched
+            for folder_path in (self.script.parent / "build", self.script.parent / "dist" / self.name):
                 if folder_path.exists():
                     shutil.rmtree(folder_path, ignore_errors=True)
                     self.logger.debug(f"Removed directory: {folder_path}")
 
-            # Clean PyInstaller cache
-            cache_dir = Path.home() / ".pyinstaller"
-            if cache_dir.exists():
-                shutil.rmtree(cache_dir, ignore_errors=True)
-                self.logger.debug("Cleared PyInstaller cache")
-
         except Exception as e:
             warning_msg = f"Warning: Could not clean some temporary files: {e}"
             self._log_progress(warning_msg)
             self.logger.warning(warning_msg)
 
-    def get_build_info(self) -> dict:
-        """Get information about the current build configuration"""
-        return {
+    @staticmethod
+    def pyinstaller_cache_dir() -> Path:
+        """Get the location of PyInstaller's global cache for this platform"""
+        if "PYINSTALLER_CONFIG_DIR" in os.environ:
+            return Path(os.environ["PYINSTALLER_CONFIG_DIR"])
+
+        if sys.platform.startswith("win"):
+            return Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")) / "pyinstaller"
+
+        if sys.platform == "darwin":
+            return Path.home() / "Library" / "Application Support" / "pyinstaller"
+
+        return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "pyinstaller"
+
+    @classmethod
+    def purge_global_cache(cls) -> List[str]:
+        """
+        Remove PyInstaller's global cache and the PyCrafter build cache
+
+        Returns:
+            List[str]: Paths of the removed cache directories
+        """
+        import shutil
+
+        removed = []
+        for cache_dir in (cls.pyinstaller_cache_dir(), Const.cache_dir):
+            if cache_dir.exists():
+                shutil.rmtree(cache_dir, ignore_errors=True)
+                removed.append(str(cache_dir))
+
+        return removed
+
+    def __setattr__(self, name, value) -> None:
+        if name in self._LIST_FIELDS:
+            value = self._clean_list(value)
+        super().__setattr__(name, value)
+        if name in self._BUILD_FIELDS:
+            self.__dict__.pop("build_info", None)
+            for cached in self._PATH_CACHES.get(name, ()):
+                self.__dict__.pop(cached, None)
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[os.stat_result]:
+        """Stat a path, returning None when it does not exist"""
+        try:
+            return path.stat()
+        except OSError:
+            return None
+
+    @functools.cached_property
+    def _script_stat(self) -> Optional[os.stat_result]:
+        return self._stat(self.script)
+
+    @functools.cached_property
+    def _icon_stat(self) -> Optional[os.stat_result]:
+        return self._stat(self.icon) if self.icon else None
+
+    @functools.cached_property
+    def _output_writable(self) -> bool:
+        return os.access(self.output.parent, os.W_OK)
+
+    @functools.cached_property
+    def build_info(self) -> types.MappingProxyType:
+        """Read-only build configuration, rebuilt only after a build attribute is reassigned"""
+        return types.MappingProxyType({
             "script": str(self.script),
             "output_dir": str(self.output),
             "executable_name": self.name,
@@ -335,12 +777,53 @@ class Crafter:
             "data_files": self.data_files,
             "binary_files": self.binary_files,
             "extra_paths": self.extra_paths
-        }
+        })
+
+    def get_build_info(self) -> dict:
+        """Get information about the current build configuration"""
+        return dict(self.build_info)
+
+
+class ToolTip:
+    """Lightweight hover tooltip for Tk widgets"""
+
+    def __init__(self, widget: tk.Widget, text: str) -> None:
+        self.widget = widget
+        self.text = text
+        self.tip: Optional[tk.Toplevel] = None
+
+        widget.bind("<Enter>", self.show, add="+")
+        widget.bind("<Leave>", self.hide, add="+")
+
+    def show(self, event=None) -> None:
+        """Display the tooltip below the widget"""
+        if self.tip:
+            return
+
+        x = self.widget.winfo_rootx() + 15
+        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
+
+        self.tip = tk.Toplevel(self.widget)
+        self.tip.wm_overrideredirect(True)
+        self.tip.wm_geometry(f"+{x}+{y}")
+
+        tk.Label(self.tip, text=self.text, justify="left",
+                 bg="#ffffe0", fg="#333333", relief="solid", borderwidth=1,
+                 font=("Segoe UI", 8), padx=6, pady=3).pack()
+
+    def hide(self, event=None) -> None:
+        """Destroy the tooltip window"""
+        if self.tip:
+            self.tip.destroy()
+            self.tip = None
 
 
 class PyCrafter:
     """ PyCrafter class contain the Application UI"""
 
+    # Embedded icon data extracted to a temporary file, shared by every window
+    _extracted_icon_path: Optional[str] = None
+
     def __init__(self, root) -> None:
 
         # Initialize Application
@@ -349,6 +832,12 @@ class PyCrafter:
         self.root.geometry(Const.geometry)
         self.root.resizable(False, False)
 
+        # Shared fonts, created once and reused by every widget
+        self.font_body = Font(root=self.root, family="Segoe UI", size=9)
+        self.font_small = Font(root=self.root, family="Segoe UI", size=8)
+        self.font_bold = Font(root=self.root, family="Segoe UI", size=10, weight="bold")
+        self.font_title = Font(root=self.root, family="Segoe UI", size=16, weight="bold")
+
         # Configure style
         self.setup_styles()
 
@@ -363,57 +852,86 @@ class PyCrafter:
         self.binary_files_var = tk.StringVar()
         self.extra_paths_var = tk.StringVar()
 
+        # Parsed comma separated fields, refreshed only when a field is edited
+        self._parsed_cache: dict[str, tuple[str, ...]] = {}
+        self._bind_parsed(self.hidden_imports_var, "hidden_imports")
+        self._bind_parsed(self.excluded_modules_var, "excluded_modules")
+        self._bind_parsed(self.data_files_var, "data_files")
+        self._bind_parsed(self.binary_files_var, "binary_files")
+        self._bind_parsed(self.extra_paths_var, "extra_paths")
+
         # Boolean variables
         self.no_console_var = tk.BooleanVar()
-        self.one_file_var = tk.BooleanVar(value=True)
+        self.one_file_var = tk.BooleanVar(value=False)
         self.admin_var = tk.BooleanVar()
-        self.clean_build_var = tk.BooleanVar()
+        self.clean_build_var = tk.BooleanVar(value=False)
         self.force_replace_var = tk.BooleanVar()
         self.optimize_var = tk.BooleanVar()
 
+        # Command of the last build, reused while the configuration is unchanged
+        self._last_cmd_key: Optional[int] = None
+        self._last_cmd: list[str] = []
+
+        # Event loop on a background thread running the builds and their PyInstaller I/O
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+
+        # Tasks starting the warm PyInstaller processes keyed by optimization, only touched by the event loop
+        self._pyi_daemons: dict = {}
+        if _pyinstaller_available() and not _FROZEN:
+            asyncio.run_coroutine_threadsafe(self._pyinstaller_daemon(False), self._loop)
+
         # Set icon
         self._set_icon()
 
         # Set up ui
         self.setup_ui()
 
+        # Screen size used to center dialogs, queried once
+        self._sw: int = self.root.winfo_screenwidth()
+        self._sh: int = self.root.winfo_screenheight()
+
+        # Build the dialogs once so showing them later is cheap
+        self._prebuild_dialogs()
+
     def setup_styles(self) -> None:
         """Configure professional styling"""
 
-        style = ttk.Style()
+        # Keep a single Style instance for the whole application
+        self._style = ttk.Style(self.root)
 
         # Configure colors and fonts
-        bg_color: str = "#f8f9fa"
-        card_color: str = "#ffffff"
+        bg_color: str = _BG_ALT
+        card_color: str = _BG
         primary_color: str = "#0066cc"
         # success_color = "#28a745"
         text_color: str = "#333333"
 
         self.root.configure(bg=bg_color)
 
-        # Configure ttk styles
-        style.configure("Title.TLabel",
-                        font=("Segoe UI", 16, "bold"),
-                        foreground=primary_color,
-                        background=bg_color)
-
-        style.configure("Heading.TLabel",
-                        font=("Segoe UI", 10, "bold"),
-                        foreground=text_color,
-                        background=card_color)
-
-        style.configure("Card.TFrame",
-                        background=card_color,
-                        relief="solid",
-                        borderwidth=1)
-
-        style.configure("Main.TFrame",
-                        background=bg_color)
-
-        style.configure("Custom.TCheckbutton",
-                        background=card_color,
-                        foreground=text_color,
-                        font=("Segoe UI", 9))
+        # Configure all ttk styles in a single theme update
+        self._style.theme_settings("clam", {
+            "TLabel": {"configure": {"font": self.font_body}},
+            "Title.TLabel": {"configure": {"font": self.font_title,
+                                           "foreground": primary_color,
+                                           "background": bg_color}},
+            "Heading.TLabel": {"configure": {"font": self.font_bold,
+                                             "foreground": text_color,
+                                             "background": card_color}},
+            "Card.TFrame": {"configure": {"background": card_color,
+                                          "relief": "solid",
+                                          "borderwidth": 1}},
+            "Main.TFrame": {"configure": {"background": bg_color}},
+            "Custom.TCheckbutton": {"configure": {"background": card_color,
+                                                  "foreground": text_color,
+                                                  "font": self.font_body}},
+            "Custom.Horizontal.TProgressbar": {"configure": {"background": _PRIMARY,
+                                                             "troughcolor": _BG_SECTION,
+                                                             "borderwidth": 1,
+                                                             "relief": "flat"}}
+        })
+        self._style.theme_use("clam")
 
     @staticmethod
     def create_card_frame(parent, title):
@@ -424,15 +942,14 @@ class PyCrafter:
             title_label.pack(anchor="w", pady=(0, 10))
         return card
 
-    @staticmethod
-    def create_file_selector(parent, label_text, variable, browse_command, file_types=None) -> None:
+    def create_file_selector(self, parent, label_text, variable, browse_command, file_types=None) -> None:
         """Create a professional file selector with label, entry, and browse button"""
-        ttk.Label(parent, text=label_text, font=("Segoe UI", 9)).pack(anchor="w", pady=(0, 3))
+        ttk.Label(parent, text=label_text).pack(anchor="w", pady=(0, 3))
 
         frame = ttk.Frame(parent)
         frame.pack(fill="x", pady=(0, 10))
 
-        entry = ttk.Entry(frame, textvariable=variable, font=("Segoe UI", 9))
+        entry = ttk.Entry(frame, textvariable=variable, font=self.font_body)
         entry.pack(side="left", fill="x", expand=True, padx=(0, 8))
 
         btn = ttk.Button(frame, text="Browse", command=browse_command, width=8)
@@ -451,7 +968,7 @@ class PyCrafter:
         title_label.pack(side="left")
 
         subtitle_label = ttk.Label(header_frame, text="Python to EXE Compiler",
-                                   font=("Segoe UI", 9), foreground="#666666")
+                                   font=self.font_body, foreground="#666666")
         subtitle_label.pack(side="left", padx=(10, 0), anchor="s", pady=(0, 2))
 
         # Main container with scrolling
@@ -472,11 +989,26 @@ class PyCrafter:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # Bind mousewheel
+        # Bind mousewheel, coalescing bursts of wheel events into a single scroll
+        wheel = {"delta": 0, "scheduled": False}
+
+        def _flush_scroll() -> None:
+            wheel["scheduled"] = False
+            # Scroll whole notches, the remainder of small touchpad deltas carries over
+            units = int(-wheel["delta"] / 120)
+            wheel["delta"] += units * 120
+            if units:
+                canvas.yview_scroll(units, "units")
+
         def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            wheel["delta"] += event.delta
+            if not wheel["scheduled"]:
+                wheel["scheduled"] = True
+                self.root.after_idle(_flush_scroll)
 
-        self.root.bind_all("<MouseWheel>", _on_mousewheel)
+        # Only listen to the wheel while the pointer is over the scrollable area
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
 
         # Content sections
         self.create_input_section(scrollable_frame)
@@ -500,8 +1032,8 @@ class PyCrafter:
                                   self.browse_output)
 
         # Executable name
-        ttk.Label(card, text="Executable Name", font=("Segoe UI", 9)).pack(anchor="w", pady=(0, 3))
-        ttk.Entry(card, textvariable=self.name_var, font=("Segoe UI", 9)).pack(fill="x", pady=(0, 10))
+        ttk.Label(card, text="Executable Name").pack(anchor="w", pady=(0, 3))
+        ttk.Entry(card, textvariable=self.name_var, font=self.font_body).pack(fill="x", pady=(0, 10))
 
         # Icon
         self.create_file_selector(card, "Icon File", self.icon_var,
@@ -525,53 +1057,66 @@ class PyCrafter:
         # Left column options
         ttk.Checkbutton(left_col, text="Hide Console Window",
                         variable=self.no_console_var, style="Custom.TCheckbutton").pack(anchor="w", pady=2)
-        ttk.Checkbutton(left_col, text="Create Single File",
-                        variable=self.one_file_var, style="Custom.TCheckbutton").pack(anchor="w", pady=2)
+        one_file_check = ttk.Checkbutton(left_col, text="Single File (slower startup)",
+                                         variable=self.one_file_var, style="Custom.TCheckbutton")
+        one_file_check.pack(anchor="w", pady=2)
+        ToolTip(one_file_check, "Single file executables extract themselves to a temporary\n"
+                                "folder on every launch, which slows down startup.")
         ttk.Checkbutton(left_col, text="Ask Admin Privileges",
                         variable=self.admin_var, style="Custom.TCheckbutton").pack(anchor="w", pady=2)
 
         # Right column options
-        ttk.Checkbutton(right_col, text="Clean Build Directory",
-                        variable=self.clean_build_var, style="Custom.TCheckbutton").pack(anchor="w", pady=2)
+        clean_build_check = ttk.Checkbutton(right_col, text="Force full rebuild (slow)",
+                                            variable=self.clean_build_var, style="Custom.TCheckbutton")
+        clean_build_check.pack(anchor="w", pady=2)
+        ToolTip(clean_build_check, "Discards PyInstaller's cached analysis for this script.\n"
+                                   "Leave unchecked to reuse it and rebuild much faster.")
         ttk.Checkbutton(right_col, text="Force Replace Existing",
                         variable=self.force_replace_var, style="Custom.TCheckbutton").pack(anchor="w", pady=2)
         ttk.Checkbutton(right_col, text="Optimize Code",
                         variable=self.optimize_var, style="Custom.TCheckbutton").pack(anchor="w", pady=2)
 
+        # Cache maintenance
+        cache_frame = ttk.Frame(card, style="Card.TFrame")
+        cache_frame.pack(fill="x", pady=(8, 0))
+
+        ttk.Button(cache_frame, text="Purge Global Cache",
+                   command=self.purge_global_cache).pack(side="right")
+
     def create_advanced_section(self, parent):
         """Create the advanced options section"""
         card = self.create_card_frame(parent, "Advanced Options")
         card.pack(fill="x", pady=(0, 15))
 
         # Hidden imports
-        ttk.Label(card, text="Hidden Imports", font=("Segoe UI", 9)).pack(anchor="w", pady=(0, 3))
+        ttk.Label(card, text="Hidden Imports").pack(anchor="w", pady=(0, 3))
         ttk.Label(card, text="Comma-separated module names that PyInstaller might miss",
-                  font=("Segoe UI", 8), foreground="#666666").pack(anchor="w", pady=(0, 3))
-        ttk.Entry(card, textvariable=self.hidden_imports_var, font=("Segoe UI", 9)).pack(fill="x", pady=(0, 10))
+                  font=self.font_small, foreground="#666666").pack(anchor="w", pady=(0, 3))
+        ttk.Entry(card, textvariable=self.hidden_imports_var, font=self.font_body).pack(fill="x", pady=(0, 10))
 
         # Excluded modules
-        ttk.Label(card, text="Excluded Modules", font=("Segoe UI", 9)).pack(anchor="w", pady=(0, 3))
+        ttk.Label(card, text="Excluded Modules").pack(anchor="w", pady=(0, 3))
         ttk.Label(card, text="Comma-separated module names to exclude from the build",
-                  font=("Segoe UI", 8), foreground="#666666").pack(anchor="w", pady=(0, 3))
-        ttk.Entry(card, textvariable=self.excluded_modules_var, font=("Segoe UI", 9)).pack(fill="x", pady=(0, 10))
+                  font=self.font_small, foreground="#666666").pack(anchor="w", pady=(0, 3))
+        ttk.Entry(card, textvariable=self.excluded_modules_var, font=self.font_body).pack(fill="x", pady=(0, 10))
 
         # Data files
-        ttk.Label(card, text="Data Files", font=("Segoe UI", 9)).pack(anchor="w", pady=(0, 3))
+        ttk.Label(card, text="Data Files").pack(anchor="w", pady=(0, 3))
         ttk.Label(card, text="Comma-separated paths to data files to include",
-                  font=("Segoe UI", 8), foreground="#666666").pack(anchor="w", pady=(0, 3))
-        ttk.Entry(card, textvariable=self.data_files_var, font=("Segoe UI", 9)).pack(fill="x", pady=(0, 10))
+                  font=self.font_small, foreground="#666666").pack(anchor="w", pady=(0, 3))
+        ttk.Entry(card, textvariable=self.data_files_var, font=self.font_body).pack(fill="x", pady=(0, 10))
 
         # Binary files
-        ttk.Label(card, text="Binary Files", font=("Segoe UI", 9)).pack(anchor="w", pady=(0, 3))
+        ttk.Label(card, text="Binary Files").pack(anchor="w", pady=(0, 3))
         ttk.Label(card, text="Comma-separated paths to binary files to include",
-                  font=("Segoe UI", 8), foreground="#666666").pack(anchor="w", pady=(0, 3))
-        ttk.Entry(card, textvariable=self.binary_files_var, font=("Segoe UI", 9)).pack(fill="x", pady=(0, 10))
+                  font=self.font_small, foreground="#666666").pack(anchor="w", pady=(0, 3))
+        ttk.Entry(card, textvariable=self.binary_files_var, font=self.font_body).pack(fill="x", pady=(0, 10))
 
         # Extra paths
-        ttk.Label(card, text="Extra Paths", font=("Segoe UI", 9)).pack(anchor="w", pady=(0, 3))
+        ttk.Label(card, text="Extra Paths").pack(anchor="w", pady=(0, 3))
         ttk.Label(card, text="Comma-separated additional paths to search for imports",
-                  font=("Segoe UI", 8), foreground="#666666").pack(anchor="w", pady=(0, 3))
-        ttk.Entry(card, textvariable=self.extra_paths_var, font=("Segoe UI", 9)).pack(fill="x", pady=(0, 20))
+                  font=self.font_small, foreground="#666666").pack(anchor="w", pady=(0, 3))
+        ttk.Entry(card, textvariable=self.extra_paths_var, font=self.font_body).pack(fill="x", pady=(0, 20))
 
     def create_action_bar(self):
         """Create the bottom action bar with buttons"""
@@ -582,7 +1127,7 @@ class PyCrafter:
         status_frame = ttk.Frame(action_frame, style="Main.TFrame")
         status_frame.pack(fill="x", pady=(0, 10))
 
-        if PYINSTALLER_AVAILABLE:
+        if _pyinstaller_available():
             status_color = "#28a745"
             status_text = "✓ PyCrafter is ready"
         else:
@@ -591,7 +1136,7 @@ class PyCrafter:
 
         status_label = tk.Label(status_frame, text=status_text,
                                 fg=status_color, bg="#f8f9fa",
-                                font=("Segoe UI", 9))
+                                font=self.font_body)
         status_label.pack(side="left")
 
         # Buttons
@@ -605,24 +1150,18 @@ class PyCrafter:
         build_btn = tk.Button(button_frame, text="Build Executable",
                               command=self.build_exe,
                               bg="#28a745", fg="white",
-                              font=("Segoe UI", 10, "bold"),
+                              font=self.font_bold,
                               relief="flat", borderwidth=0,
                               padx=20, pady=10,
-                              cursor="hand2")
+                              cursor="hand2",
+                              activebackground="#218838", activeforeground="white")
         build_btn.pack(side="right", fill="x", expand=True, padx=(10, 0))
 
-        # Hover effects for build button
-        def on_enter(e) -> None:
-            build_btn.configure(bg="#218838")
-
-        def on_leave(e) -> None:
-            build_btn.configure(bg="#28a745")
-
-        build_btn.bind("<Enter>", on_enter)
-        build_btn.bind("<Leave>", on_leave)
+        self.build_btn = build_btn
 
     def browse_script(self) -> None:
         """ This method will borse the script"""
+        from tkinter import filedialog
 
         filename = filedialog.askopenfilename(
             title="Select Python Script",
@@ -637,6 +1176,7 @@ class PyCrafter:
 
     def browse_output(self) -> None:
         """ This method will borse the output path"""
+        from tkinter import filedialog
 
         dirname = filedialog.askdirectory(title="Select Output Directory")
         if dirname:
@@ -644,6 +1184,7 @@ class PyCrafter:
 
     def browse_icon(self) -> None:
         """ This method will borse the icon path"""
+        from tkinter import filedialog
 
         filename = filedialog.askopenfilename(
             title="Select Icon File",
@@ -653,6 +1194,20 @@ class PyCrafter:
         if filename:
             self.icon_var.set(filename)
 
+    @staticmethod
+    def purge_global_cache() -> None:
+        """ This method will purge the shared PyInstaller and PyCrafter caches"""
+        from tkinter import messagebox
+
+        if not messagebox.askyesno("Purge Global Cache",
+                                   "This removes cached analysis data for all projects,\n"
+                                   "the next builds will be slower. Continue?"):
+            return
+
+        removed = Crafter.purge_global_cache()
+        messagebox.showinfo("Purge Global Cache",
+                            "Removed:\n" + "\n".join(removed) if removed else "Cache is already empty.")
+
     def show_about(self) -> None:
         """ This method will show the about section"""
 
@@ -675,19 +1230,26 @@ class PyCrafter:
                 return
 
             # Fallback: Embed icon data directly
-            if hasattr(self, '_icon_data'):
-                import tempfile
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.ico') as tmp:
-                    tmp.write(self._icon_data)
-                    tmp_path = tmp.name
-                self.root.iconbitmap(tmp_path)
-                # Schedule cleanup
-                self.root.after(1000, lambda: os.unlink(tmp_path) if os.path.exists(tmp_path) else None)
+            self.icon_path = self._extract_icon_data()
+            if self.icon_path:
+                self.root.iconbitmap(self.icon_path)
 
         except Exception as e:
             print(f"Failed to set app icon: {e}")
             self.icon_path = None
 
+    def _extract_icon_data(self) -> Optional[str]:
+        """Write the embedded icon data to a temporary file once per process"""
+        if PyCrafter._extracted_icon_path is None and hasattr(self, '_icon_data'):
+            import tempfile
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.ico') as tmp:
+                tmp.write(self._icon_data)
+
+            PyCrafter._extracted_icon_path = tmp.name
+            atexit.register(lambda: os.unlink(tmp.name) if os.path.exists(tmp.name) else None)
+
+        return PyCrafter._extracted_icon_path
+
     def _apply_icon(self, window: tk.Toplevel) -> None:
         """Applies the main window's icon to a dialog window, works in both PyCharm and EXE."""
         try:
@@ -707,320 +1269,283 @@ class PyCrafter:
                 window.iconbitmap(icon_path)
                 return
 
-            # Method 3: Try using a temporary file (fallback)
-            if hasattr(self, '_icon_data'):
-                import tempfile
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.ico') as tmp:
-                    tmp.write(self._icon_data)
-                    tmp_path = tmp.name
-                window.iconbitmap(tmp_path)
-                # Schedule cleanup
-                window.after(1000, lambda: os.unlink(tmp_path) if os.path.exists(tmp_path) else None)
+            # Method 3: Try using the extracted icon data (fallback)
+            extracted_icon_path = self._extract_icon_data()
+            if extracted_icon_path:
+                window.iconbitmap(extracted_icon_path)
 
         except Exception as e:
             print(f"Could not set dialog icon: {e}")
 
     @staticmethod
-    def parse_comma_separated(text: str) -> Optional[List[str]]:
+    def parse_comma_separated(text: str) -> tuple[str, ...]:
         """ This method will parse comma separated string"""
 
-        if not text.strip():
-            return None
-        return [item.strip() for item in text.split(",") if item.strip()]
+        return tuple(dict.fromkeys(item for item in (item.strip() for item in text.split(",")) if item))
+
+    def _bind_parsed(self, variable: tk.StringVar, key: str) -> None:
+        """ This method will keep the parsed value of a comma separated field up to date"""
+
+        variable.trace_add("write", lambda *_: self._parsed_cache.__setitem__(
+            key, self.parse_comma_separated(variable.get())))
 
     def build_exe(self) -> None:
         """ This method will build the executable"""
 
         if not self.script_var.get():
-            messagebox.showerror("Validation Error", "Please select a Python script to compile.")
+            self.show_error("Validation Error", "Please select a Python script to compile.")
             return
 
-        if not PYINSTALLER_AVAILABLE:
-            messagebox.showerror("PyInstaller Error",
-                                 "PyInstaller is not available. Please install it using:\npip install pyinstaller")
+        if not _pyinstaller_available():
+            self.show_error("PyInstaller Error",
+                            "PyInstaller is not available. Please install it using:\npip install pyinstaller")
             return
 
-        # Show building dialog
-        building_dialog = self.show_building_dialog()
-
         # Prepare parameters
         script = self.script_var.get()
-        output = self.output_var.get() if self.output_var.get() else None
-        icon = self.icon_var.get() if self.icon_var.get() else None
-        name = self.name_var.get() if self.name_var.get() else None
-        no_console = self.no_console_var.get()
-        one_file = self.one_file_var.get()
-        admin = self.admin_var.get()
-        clean_build = self.clean_build_var.get()
-        force_replace = self.force_replace_var.get()
-        optimize = self.optimize_var.get()
-        hidden_imports = self.parse_comma_separated(self.hidden_imports_var.get())
-        excluded_modules = self.parse_comma_separated(self.excluded_modules_var.get())
-        data_files = self.parse_comma_separated(self.data_files_var.get())
-        binary_files = self.parse_comma_separated(self.binary_files_var.get())
-        extra_paths = self.parse_comma_separated(self.extra_paths_var.get())
-
-        # Build command
-        cmd: list[str] = ["pyinstaller"]
-
-        if one_file:
-            cmd.append("--onefile")
-        if no_console:
-            cmd.append("--noconsole")
-        if admin:
-            cmd.append("--uac-admin")
-        if clean_build:
-            cmd.append("--clean")
-        if force_replace:
-            cmd.append("--noconfirm")
-        if optimize:
-            cmd.append("--optimize=2")
-
-        if output:
-            cmd.extend(["--distpath", output])
-        if icon:
-            cmd.extend(["--icon", icon])
-        if name:
-            cmd.extend(["--name", name])
-
-        if hidden_imports:
-            for module in hidden_imports:
-                cmd.extend(["--hidden-import", module])
-
-        if excluded_modules:
-            for module in excluded_modules:
-                cmd.extend(["--exclude-module", module])
-
-        if data_files:
-            for file_path in data_files:
-                cmd.extend(["--add-data", f"{file_path};."])
-
-        if binary_files:
-            for file_path in binary_files:
-                cmd.extend(["--add-binary", f"{file_path};."])
+        script_path = Path(script)
+        script_dir = script_path.parent
+        output = self.output_var.get() or str(script_dir / "dist")
 
-        if extra_paths:
-            for path in extra_paths:
-                cmd.extend(["--paths", path])
+        # PyInstaller runs from the script directory, so relative outputs resolve against it
+        resolved_output = (script_dir / output).resolve()
+        optimize = self.optimize_var.get()
 
-        cmd.append(script)
+        values = {
+            "one_file": self.one_file_var.get(),
+            "no_console": self.no_console_var.get(),
+            "admin": self.admin_var.get(),
+            "clean_build": self.clean_build_var.get(),
+            "force_replace": _needs_noconfirm(self.force_replace_var.get(), self.one_file_var.get()),
+            "output": output,
+            "icon": self.icon_var.get(),
+            "name": self.name_var.get(),
+            "hidden_imports": self._parsed_cache.get("hidden_imports", ()),
+            "excluded_modules": self._parsed_cache.get("excluded_modules", ()),
+            "data_files": self._parsed_cache.get("data_files", ()),
+            "binary_files": self._parsed_cache.get("binary_files", ()),
+            "extra_paths": self._parsed_cache.get("extra_paths", ())
+        }
 
-        def run_build() -> None:
-            """Optimized build function with explorer integration"""
+        # Leave out files and search paths that do not exist instead of failing the build
+        notes: list[str] = []
+        for key, label in (("data_files", "data file"), ("binary_files", "binary file"), ("extra_paths", "path")):
+            # Entries may carry a destination after the source, as in 'assets;assets'
+            missing = [item for item in values[key]
+                       if not (script_dir / _SPEC_SPLIT_RE.split(item, maxsplit=1)[0]).exists()]
+            if missing:
+                notes.extend(f"Skipping missing {label}: {item}" for item in missing)
+                values[key] = tuple(item for item in values[key] if item not in missing)
+
+        # PyInstaller accepts a module that is both hidden-imported and excluded without a word
+        conflicts = sorted(set(values["hidden_imports"]).intersection(values["excluded_modules"]))
+        if conflicts:
+            notes.append(f"Warning: modules both hidden-imported and excluded: {', '.join(conflicts)}")
+
+        build_key = hash((script, optimize, tuple(values.items())))
+
+        # Output of the build and the hash of the inputs it was built from
+        name = values["name"] or script_path.stem
+        artifact = _artifact_path(resolved_output, name, values["one_file"])
+        hash_file = resolved_output / f"{name}.hash"
+
+        # Reuse the command of the previous build when the configuration is unchanged
+        if build_key == self._last_cmd_key:
+            cmd = self._last_cmd
+        else:
+            # Build command in one pass over the option tables
+            cmd: list[str] = ["pyinstaller", *itertools.chain(
+                (flag for key, flag in _BOOL_FLAGS if values[key]),
+                itertools.chain.from_iterable((flag, values[key]) for key, flag in _KV_FLAGS if values[key]),
+                itertools.chain.from_iterable((flag, item if _SPEC_SPLIT_RE.search(item) else item + suffix)
+                                              for key, flag, suffix in _REPEATED_FLAGS for item in values[key])
+            )]
+
+            # Keep one work directory per script and name, the same one Crafter uses,
+            # so PyInstaller reuses its analysis without a new tree for every option change
+            work_dir = _cache_dir_for("work", str(script_path.resolve()), name)
+            work_dir.mkdir(parents=True, exist_ok=True)
+            cmd.extend(["--workpath", str(work_dir)])
+
+            cmd.append(script)
+            self._last_cmd_key, self._last_cmd = build_key, cmd
+
+        log_queue: queue.Queue = queue.Queue()
+        result: dict = {}
+
+        for note in notes:
+            log_queue.put(f"{note}\n")
+
+        def inputs_hash() -> str:
+            """Hash the build command, the script sources, the bundled files and the environment"""
+            h = hashlib.blake2b(digest_size=16)
+            h.update("\x00".join(cmd).encode())
+            h.update(b"O2" if optimize else b"O0")
+
+            _hash_build_inputs(h, script_dir,
+                               (script_dir / _SPEC_SPLIT_RE.split(spec, maxsplit=1)[0]
+                                for spec in (*values["data_files"], *values["binary_files"])),
+                               script_dir / values["icon"] if values["icon"] else None)
+            return h.hexdigest()
+
+        async def run_build() -> None:
+            """Run PyInstaller in the warm daemon and pump its output into the log queue"""
+            import json
+
+            process = None
             try:
-                result = subprocess.run(cmd, capture_output=True, text=True, cwd=Path(script).parent)
-                building_dialog.destroy()
-
-                if result.returncode == 0:
-                    output_path = Path(output) if output else Path(script).parent
-                    show_success_with_explorer(output_path)
+                # Skip PyInstaller when the previous build came from identical inputs
+                digest = await asyncio.to_thread(inputs_hash)
+                try:
+                    unchanged = (not values["clean_build"] and artifact.exists()
+                                 and hash_file.read_text() == digest)
+                except OSError:
+                    unchanged = False
+
+                if unchanged:
+                    log_queue.put(f"Inputs unchanged, reusing {artifact}\n")
+                    result["returncode"] = 0
+                    return
+
+                if _FROZEN:
+                    # No interpreter to host the warm daemon, run PyInstaller for this build only
+                    process = await asyncio.create_subprocess_exec(*_PYINSTALLER_CMD, *cmd[1:],
+                                                                   stdin=asyncio.subprocess.DEVNULL,
+                                                                   stdout=asyncio.subprocess.PIPE,
+                                                                   stderr=asyncio.subprocess.STDOUT,
+                                                                   cwd=script_dir, env=_pyinstaller_env(optimize))
+
+                    async for raw_line in process.stdout:
+                        log_queue.put(raw_line.decode(errors="replace"))
+
+                    result["returncode"] = await process.wait()
                 else:
-                    show_build_error()
+                    process = await self._pyinstaller_daemon(optimize)
+                    process.stdin.write((json.dumps({"cwd": str(script_dir.resolve()), "args": cmd[1:]}) + "\n").encode())
+                    await process.stdin.drain()
+
+                    async for raw_line in process.stdout:
+                        line = raw_line.decode(errors="replace")
+                        if line.startswith("DONE:"):
+                            result["returncode"] = int(line[5:])
+                            break
+                        log_queue.put(line)
+                    else:
+                        raise CrafterError("PyInstaller process exited unexpectedly")
+
+                if result["returncode"] == 0:
+                    hash_file.write_text(digest)
+
+            except asyncio.CancelledError:
+                result["cancelled"] = True
+                await self._stop_pyinstaller(process, optimize)
 
             except Exception as e:
-                building_dialog.destroy()
-                messagebox.showerror("Build Error", f"Build failed: {str(e)}")
+                result["error"] = e
+                await self._stop_pyinstaller(process, optimize)
 
-        def show_success_with_explorer(output_path: Path) -> None:
-            """ This method will show the success dialog widget"""
+            finally:
+                # Tell the drain loop that no more output will come
+                log_queue.put(None)
 
+        def finish_build() -> None:
+            """Close the building dialog and report the build result on the Tk thread"""
+            building_dialog.close_dialog()
+            self.build_btn.configure(state="normal")
 
-            def open_explorer():
-                """Cross-platform file explorer opener"""
-                try:
-                    path_str = str(output_path.resolve())
-                    system = platform.system()
-
-                    if system == "Windows":
-                        os.startfile(path_str)
-                    elif system == "Darwin":  # macOS
-                        subprocess.Popen(["open", path_str])
-                    else:  # Linux and others
-                        subprocess.Popen(["xdg-open", path_str])
-                except Exception as e:
-                    messagebox.showerror("Error", f"Cannot open explorer: {e}")
-
-            def close_dialog() -> None:
-                """ This function will close the dialog"""
-                dialog.destroy()
-
-            # Create optimized dialog
-            dialog = tk.Toplevel(self.root)
-            dialog.title("Build Successful")
-            dialog.geometry("420x240")
-            dialog.resizable(False, False)
-            self._apply_icon(dialog)  # Apply the icon
-            dialog.transient(self.root)
-            dialog.grab_set()
-
-            # Center dialog
-            # dialog.update_idletasks()
-
-            x: int = (dialog.winfo_screenwidth() - 420) // 2
-            y: int = (dialog.winfo_screenheight() - 180) // 2
-
-            dialog.geometry(f"420x280+{x}+{y}")
-
-            # Main container
-            main = tk.Frame(dialog, padx=20, pady=15)
-            main.pack(fill="both", expand=True)
-
-            # Header with icon
-            header = tk.Frame(main)
-            header.pack(fill="x", pady=(0, 15))
-
-            tk.Label(header, text="✅", font=("Segoe UI", 20)).pack(side="left")
-            tk.Label(header, text="Build Successful!",
-                     font=("Segoe UI", 14, "bold"),
-                     fg="#2e7d32").pack(side="left", padx=(10, 0))
-
-            # Message
-            tk.Label(main, text="Your executable has been created successfully!",
-                     font=("Segoe UI", 10)).pack(pady=(0, 10))
-
-            # Path display
-            path_frame = tk.Frame(main, bg="#f8f9fa", relief="solid", bd=1)
-            path_frame.pack(fill="x", pady=(0, 15))
-
-            tk.Label(path_frame, text="Output:", font=("Segoe UI", 8, "bold"),
-                     bg="#f8f9fa").pack(anchor="w", padx=8, pady=(5, 0))
-            tk.Label(path_frame, text=str(output_path), font=("Segoe UI", 8),
-                     fg="#0066cc", bg="#f8f9fa", wraplength=380).pack(anchor="w", padx=8, pady=(0, 5))
-
-            # Buttons
-            btn_frame = tk.Frame(main)
-            btn_frame.pack(fill="x")
-
-            # Explorer button - primary action
-            explorer_btn = tk.Button(btn_frame, text="📂 Open in Explorer",
-                                     command=open_explorer,
-                                     bg="#4CAF50", fg="white",
-                                     font=("Segoe UI", 10, "bold"),
-                                     relief="flat", cursor="hand2",
-                                     padx=20, pady=8)
-            explorer_btn.pack(side="left")
-
-            # Close button
-            close_btn = tk.Button(btn_frame, text="Close",
-                                  command=close_dialog,
-                                  bg="#757575", fg="white",
-                                  font=("Segoe UI", 10),
-                                  relief="flat", cursor="hand2",
-                                  padx=20, pady=8)
-            close_btn.pack(side="right")
-
-            # Optimized hover effects
-            def setup_hover(button, normal_color, hover_color):
-                button.bind("<Enter>", lambda e: button.config(bg=hover_color))
-                button.bind("<Leave>", lambda e: button.config(bg=normal_color))
-
-            setup_hover(explorer_btn, "#4CAF50", "#45a049")
-            setup_hover(close_btn, "#757575", "#616161")
-
-            # Keyboard shortcuts
-            dialog.bind("<Return>", lambda e: open_explorer())
-            dialog.bind("<Escape>", lambda e: close_dialog())
-            dialog.focus_set()
-
-        def show_build_error() -> None:
-            """Minimalist build error dialog"""
-
-            self._apply_icon(dialog)  # Apply the icon
-
-            # Create minimal dialog
-            dialog = tk.Toplevel(self.root)
-            dialog.title("Build Failed")
-            dialog.geometry("350x150")
-            dialog.resizable(False, False)
-            dialog.configure(bg="#f8f8f8")
-            dialog.transient(self.root)
-            dialog.grab_set()
-
-            # Center dialog
-            dialog.update_idletasks()
-            x: int = (dialog.winfo_screenwidth() - 350) // 2
-            y: int = (dialog.winfo_screenheight() - 150) // 2
-            dialog.geometry(f"350x150+{x}+{y}")
-
-            # Content frame
-            frame = tk.Frame(dialog, bg="#f8f8f8", padx=20, pady=20)
-            frame.pack(fill="both", expand=True)
-
-            # Error message
-            tk.Label(frame, text="❌ Build Failed",
-                     font=("Segoe UI", 12, "bold"),
-                     fg="#d32f2f", bg="#f8f8f8").pack(pady=(0, 10))
-
-            tk.Label(frame, text="The build process encountered an error.",
-                     font=("Segoe UI", 9),
-                     fg="#333", bg="#f8f8f8").pack(pady=(0, 15))
-
-            # OK button
-            tk.Button(frame, text="OK",
-                      command=dialog.destroy,
-                      bg="#e53e3e", fg="white",
-                      font=("Segoe UI", 9),
-                      relief="flat",
-                      padx=30, pady=6).pack()
-
-            # Keyboard shortcut
-            dialog.bind("<Return>", lambda e: dialog.destroy())
-            dialog.bind("<Escape>", lambda e: dialog.destroy())
-            dialog.focus_set()
-
-        def open_output_folder(path: Path) -> None:
-            """Standalone function to open output folder - can be used elsewhere"""
-            try:
-                path_str = str(path.resolve())
-                system = platform.system()
+            if "cancelled" in result:
+                return
 
-                commands = {
-                    "Windows": lambda: os.startfile(path_str),
-                    "Darwin": lambda: subprocess.Popen(["open", path_str]),
-                    "Linux": lambda: subprocess.Popen(["xdg-open", path_str])
-                }
+            if "error" in result:
+                self.show_error("Build Error", f"Build failed: {str(result['error'])}")
+            elif result["returncode"] == 0:
+                self.show_success_with_explorer(resolved_output)
+            else:
+                self.show_error("Build Failed", "The build process encountered an error.")
+
+        # Show building dialog, no other build can start until this one finishes
+        self.build_btn.configure(state="disabled")
+
+        # Run the build on the event loop, its output is drained on the Tk thread
+        build = asyncio.run_coroutine_threadsafe(run_build(), self._loop)
+        building_dialog = self.show_building_dialog(on_cancel=build.cancel)
+        self.root.after(50, self._drain_log_queue, log_queue, building_dialog, finish_build)
+
+    async def _pyinstaller_daemon(self, optimize: bool) -> asyncio.subprocess.Process:
+        """Get the running PyInstaller daemon for the optimization level, starting it if needed"""
+        # The starting task is stored, not the process, so concurrent callers share one daemon
+        starting = self._pyi_daemons.get(optimize)
+        if starting is None or (starting.done() and (starting.cancelled() or starting.exception() is not None
+                                                     or starting.result().returncode is not None)):
+            starting = self._loop.create_task(asyncio.create_subprocess_exec(
+                sys.executable, "-u", "-c", _PYINSTALLER_DAEMON_SRC,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                env=_pyinstaller_env(optimize)))
+            self._pyi_daemons[optimize] = starting
+
+        # Shielded so a cancelled build does not cancel the daemon other builds wait for
+        return await asyncio.shield(starting)
+
+    async def _stop_pyinstaller(self, process: Optional[asyncio.subprocess.Process], optimize: bool) -> None:
+        """Terminate a PyInstaller process left mid-build, its unread output would leak into the next build"""
+        if process is None or process.returncode is not None:
+            return
 
-                if system in commands:
-                    commands[system]()
-                else:
-                    # Fallback for other systems
-                    subprocess.Popen(["xdg-open", path_str])
+        process.terminate()
+        await process.wait()
+        # The next build starts a fresh daemon
+        self._pyi_daemons.pop(optimize, None)
 
-            except Exception as e:
-                messagebox.showerror("Explorer Error", f"Cannot open folder: {e}")
+    def _drain_log_queue(self, log_queue: queue.Queue, dialog: tk.Toplevel, on_finish: Callable[[], None]) -> None:
+        """Append queued build output to the building dialog in batches until the build ends"""
+        lines = []
+        finished = False
 
-        # Start optimized build thread
-        threading.Thread(target=run_build, daemon=True).start()
+        try:
+            while len(lines) < 100:
+                line = log_queue.get_nowait()
+                if line is None:
+                    finished = True
+                    break
+                lines.append(line)
+
+        except queue.Empty:
+            pass
+
+        if lines:
+            dialog.append_log("".join(lines))
+
+            # Surface the latest PyInstaller step in the status line
+            status = lines[-1].strip()
+            if status:
+                dialog.update_status(status[:80])
+
+        if finished:
+            on_finish()
+        else:
+            self.root.after(50, self._drain_log_queue, log_queue, dialog, on_finish)
 
-    def show_building_dialog(self) -> tk.Toplevel:
-        """Show an enhanced building progress dialog centered on parent window"""
+    def _prebuild_dialogs(self) -> None:
+        """Create the building, success and error dialogs once, hidden until they are needed"""
+        self._building_dialog = self._create_building_dialog()
+        self._success_dialog = self._create_success_dialog()
+        self._error_dialog = self._create_error_dialog()
 
+    def _create_building_dialog(self) -> tk.Toplevel:
+        """Create the hidden building progress dialog"""
 
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.title("PyCrafter - Building Executable")
         self._apply_icon(dialog)  # Apply the icon
-        dialog.geometry("400x180")
         dialog.resizable(False, False)
         dialog.transient(self.root)
-        dialog.grab_set()
 
         # Modern styling
         dialog.configure(bg="#f8f9fa")
 
-        parent_x = self.root.winfo_x()
-        parent_y = self.root.winfo_y()
-        parent_width = self.root.winfo_width()
-        parent_height = self.root.winfo_height()
-
-        dialog_width: int = 400
-        dialog_height: int = 250
-
-        # Calculate center position relative to parent
-        x: int = parent_x + (parent_width - dialog_width) // 2
-        y: int = parent_y + (parent_height - dialog_height) // 2
-
-        dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
-
         # Main container with the subtle border
         main_frame = tk.Frame(dialog, bg="#ffffff", relief="solid", bd=1)
         main_frame.pack(fill="both", expand=True, padx=15, pady=15)
@@ -1046,67 +1571,277 @@ class PyCrafter:
         progress_frame = tk.Frame(content_frame, bg="#ffffff")
         progress_frame.pack(fill="x", pady=(0, 15))
 
-        # Configure progress bar style first
-        style = ttk.Style()
-
-        try:
-            # Try to configure custom style, fallback to default if it fails
-            style.configure("Custom.Horizontal.TProgressbar",
-                            background="#3498db",
-                            troughcolor="#ecf0f1",
-                            borderwidth=1,
-                            relief="flat")
-            progress_style = "Custom.Horizontal.TProgressbar"
-        except Exception:
-            progress_style = "Horizontal.TProgressbar"
-
+        # Progress bar style is configured once in setup_styles
         progress = ttk.Progressbar(progress_frame,
                                    mode='indeterminate',
                                    length=300,
-                                   style=progress_style)
+                                   style="Custom.Horizontal.TProgressbar")
         progress.pack()
-        progress.start(10)  # Start animation immediately
 
         # Status text with better messaging
-        status_label = tk.Label(content_frame,
-                                text="Analyzing dependencies and bundling resources...\nThis may take a few moments.",
-                                font=("Segoe UI", 9), fg="#7f8c8d", bg="#ffffff")
+        status_label = tk.Label(content_frame, font=("Segoe UI", 9), fg="#7f8c8d", bg="#ffffff")
         status_label.pack()
 
+        # Cancel button, kept below the log which takes the remaining space
+        cancel_btn = tk.Button(content_frame, text="Cancel",
+                               command=lambda: cancel_build(),
+                               bg="#757575", fg="white",
+                               font=("Segoe UI", 9),
+                               relief="flat", cursor="hand2",
+                               padx=20, pady=4)
+        cancel_btn.pack(side="bottom", pady=(10, 0))
+
+        # Build output log
+        from tkinter import scrolledtext
+
+        log_text = scrolledtext.ScrolledText(content_frame, height=8, font=("Consolas", 8),
+                                             fg="#34495e", bg="#f8f9fa", relief="flat",
+                                             state="disabled")
+        log_text.pack(fill="both", expand=True, pady=(10, 0))
+
         # Store progress bar reference for potential updates
         dialog.progress = progress
         dialog.status_label = status_label
+        dialog.log_text = log_text
+        dialog.cancel_btn = cancel_btn
+        dialog.on_cancel = lambda: None
+
+        # Method to cancel the running build
+        def cancel_build():
+            cancel_btn.configure(state="disabled")
+            dialog.status_label.config(text="Cancelling build...")
+            dialog.on_cancel()
 
         # Method to update status text
         def update_status(text: str):
             dialog.status_label.config(text=text)
             dialog.update_idletasks()
 
-        # Method to close dialog properly
+        # Method to append build output to the log
+        def append_log(text: str):
+            log_text.configure(state="normal")
+            log_text.insert("end", text)
+
+            # Keep only the tail of the log so long builds do not grow the widget unbounded
+            if int(log_text.index("end-1c").split(".")[0]) > _LOG_MAX_LINES:
+                log_text.delete("1.0", f"end-{_LOG_MAX_LINES}l")
+
+            log_text.see("end")
+            log_text.configure(state="disabled")
+
+        # Method to hide the dialog until the next build
         def close_dialog():
             try:
                 progress.stop()
                 dialog.grab_release()
-                dialog.destroy()
-            except:
+                dialog.withdraw()
+            except tk.TclError:
                 pass
 
         dialog.update_status = update_status
+        dialog.append_log = append_log
         dialog.close_dialog = close_dialog
 
+        # Closing the window during a build cancels it
+        dialog.protocol("WM_DELETE_WINDOW", cancel_build)
+
+        return dialog
+
+    def show_building_dialog(self, on_cancel: Callable[[], None]) -> tk.Toplevel:
+        """Show the building progress dialog centered on parent window"""
+        dialog = self._building_dialog
+        dialog.on_cancel = on_cancel
+        dialog.cancel_btn.configure(state="normal")
+
+        # Center on the parent, which may have moved since the last build
+        dialog.geometry(_center_on(self.root, 400, 440))
+
+        # Reset the content left over from the previous build
+        dialog.status_label.config(
+            text="Analyzing dependencies and bundling resources...\nThis may take a few moments.")
+        dialog.log_text.configure(state="normal")
+        dialog.log_text.delete("1.0", "end")
+        dialog.log_text.configure(state="disabled")
+
+        dialog.deiconify()
+        dialog.grab_set()
+        dialog.progress.start(50)  # Start animation immediately
+
         # Ensure dialog stays on top and focused
         dialog.lift()
         dialog.focus_set()
 
-        # Handle window close event (disable close button during build)
-        dialog.protocol("WM_DELETE_WINDOW", lambda: None)
-
-        # Force update to ensure everything renders
+        # Lay out the dialog before the build starts, the main loop draws it
         dialog.update_idletasks()
-        dialog.update()
 
         return dialog
 
+    def _create_success_dialog(self) -> tk.Toplevel:
+        """Create the hidden build success dialog"""
+
+        def open_explorer():
+            """Cross-platform file explorer opener"""
+            try:
+                _OPEN_FOLDER(str(dialog.output_path))
+            except Exception as e:
+                self.show_error("Error", f"Cannot open explorer: {e}")
+
+        def close_dialog() -> None:
+            """ This function will hide the dialog"""
+            dialog.grab_release()
+            dialog.withdraw()
+
+        # Create optimized dialog
+        dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
+        dialog.title("Build Successful")
+        dialog.resizable(False, False)
+        self._apply_icon(dialog)  # Apply the icon
+        dialog.transient(self.root)
+
+        # Center dialog
+        x: int = (self._sw - 420) // 2
+        y: int = (self._sh - 180) // 2
+
+        dialog.geometry(f"420x280+{x}+{y}")
+
+        # Main container
+        main = tk.Frame(dialog, padx=20, pady=15)
+        main.pack(fill="both", expand=True)
+
+        # Header with icon
+        header = tk.Frame(main)
+        header.pack(fill="x", pady=(0, 15))
+
+        tk.Label(header, text="✅", font=("Segoe UI", 20)).pack(side="left")
+        tk.Label(header, text="Build Successful!",
+                 font=("Segoe UI", 14, "bold"),
+                 fg="#2e7d32").pack(side="left", padx=(10, 0))
+
+        # Message
+        tk.Label(main, text="Your executable has been created successfully!",
+                 font=("Segoe UI", 10)).pack(pady=(0, 10))
+
+        # Path display
+        path_frame = tk.Frame(main, bg="#f8f9fa", relief="solid", bd=1)
+        path_frame.pack(fill="x", pady=(0, 15))
+
+        tk.Label(path_frame, text="Output:", font=("Segoe UI", 8, "bold"),
+                 bg="#f8f9fa").pack(anchor="w", padx=8, pady=(5, 0))
+        path_label = tk.Label(path_frame, font=("Segoe UI", 8),
+                              fg="#0066cc", bg="#f8f9fa", wraplength=380)
+        path_label.pack(anchor="w", padx=8, pady=(0, 5))
+
+        # Buttons
+        btn_frame = tk.Frame(main)
+        btn_frame.pack(fill="x")
+
+        # Explorer button - primary action
+        explorer_btn = tk.Button(btn_frame, text="📂 Open in Explorer",
+                                 command=open_explorer,
+                                 bg="#4CAF50", fg="white",
+                                 activebackground="#45a049", activeforeground="white",
+                                 font=("Segoe UI", 10, "bold"),
+                                 relief="flat", cursor="hand2",
+                                 padx=20, pady=8)
+        explorer_btn.pack(side="left")
+
+        # Close button
+        close_btn = tk.Button(btn_frame, text="Close",
+                              command=close_dialog,
+                              bg="#757575", fg="white",
+                              activebackground="#616161", activeforeground="white",
+                              font=("Segoe UI", 10),
+                              relief="flat", cursor="hand2",
+                              padx=20, pady=8)
+        close_btn.pack(side="right")
+
+        # Keyboard shortcuts
+        dialog.bind("<Return>", lambda e: open_explorer())
+        dialog.bind("<Escape>", lambda e: close_dialog())
+        dialog.protocol("WM_DELETE_WINDOW", close_dialog)
+
+        dialog.path_label = path_label
+        dialog.output_path = Path()
+
+        return dialog
+
+    def show_success_with_explorer(self, output_path: Path) -> None:
+        """ This method will show the success dialog widget"""
+        dialog = self._success_dialog
+        dialog.output_path = output_path
+        dialog.path_label.config(text=str(output_path))
+
+        dialog.deiconify()
+        dialog.grab_set()
+        dialog.lift()
+        dialog.focus_set()
+
+    def _create_error_dialog(self) -> tk.Toplevel:
+        """Create the hidden error dialog"""
+
+        def close_dialog() -> None:
+            """ This function will hide the dialog"""
+            dialog.grab_release()
+            dialog.withdraw()
+
+        dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
+        self._apply_icon(dialog)  # Apply the icon
+
+        # Center dialog on the screen
+        dialog.geometry(f"380x180+{(self._sw - 380) // 2}+{(self._sh - 180) // 2}")
+        dialog.resizable(False, False)
+        dialog.configure(bg="#f8f8f8")
+        dialog.transient(self.root)
+
+        # Content frame
+        frame = tk.Frame(dialog, bg="#f8f8f8", padx=20, pady=20)
+        frame.pack(fill="both", expand=True)
+
+        # Error message
+        title_label = tk.Label(frame, font=("Segoe UI", 12, "bold"),
+                               fg="#d32f2f", bg="#f8f8f8")
+        title_label.pack(pady=(0, 10))
+
+        message_label = tk.Label(frame, font=("Segoe UI", 9), fg="#333", bg="#f8f8f8",
+                                 wraplength=340, justify="center")
+        message_label.pack(pady=(0, 15))
+
+        # OK button
+        tk.Button(frame, text="OK",
+                  command=close_dialog,
+                  bg="#e53e3e", fg="white",
+                  font=("Segoe UI", 9),
+                  relief="flat",
+                  padx=30, pady=6).pack()
+
+        # Keyboard shortcut
+        dialog.bind("<Return>", lambda e: close_dialog())
+        dialog.bind("<Escape>", lambda e: close_dialog())
+        dialog.protocol("WM_DELETE_WINDOW", close_dialog)
+
+        dialog.title_label = title_label
+        dialog.message_label = message_label
+
+        return dialog
+
+    def show_error(self, title: str, message: str) -> None:
+        """ This method will show the error dialog, it can be called from any thread"""
+        if threading.current_thread() is not threading.main_thread():
+            self.root.after(0, self.show_error, title, message)
+            return
+
+        dialog = self._error_dialog
+        dialog.title(title)
+        dialog.title_label.config(text=f"❌ {title}")
+        dialog.message_label.config(text=message)
+
+        dialog.deiconify()
+        dialog.grab_set()
+        dialog.lift()
+        dialog.focus_set()
+
 
 class AboutDialog:
     """Optimized About Dialog for PyCrafter application"""
@@ -1122,16 +1857,18 @@ class AboutDialog:
         'pady': 8
     }
 
-    # Color mappings for hover effects
+    # Colors Tk shows natively while a button is hovered or pressed
     HOVER_COLORS: dict[str, str] = {
         'secondary': '#2980b9',
         'primary': '#c0392b'
     }
 
-    ACTIVE_COLORS: dict[str, str] = {
-        'secondary': '#21618c',
-        'primary': '#922b21'
-    }
+    # Tool descriptions parsed once into (description, url) pairs
+    _PARSED_DESC: tuple[tuple[str, str], ...] = tuple(
+        (lines[0], lines[1].replace("Official website: ", "").replace("Official documentation: ", "")
+         if len(lines) > 1 else "")
+        for lines in (tool_desc.strip().split('\n', 1) for tool_desc in Const.description)
+    )
 
     def __init__(self, parent: tk.Tk) -> None:
         self.parent = parent
@@ -1154,11 +1891,10 @@ class AboutDialog:
         """Create and configure the main dialog window"""
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title("About - PyCraft")
-        self.dialog.geometry(self.DIALOG_SIZE)
         self.dialog.resizable(False, False)
         self.dialog.transient(self.parent)
         self.dialog.grab_set()
-        self.dialog.configure(bg=Const.colors['background_alt'])
+        self.dialog.configure(bg=_BG_ALT)
 
         self._set_icon()
         self._center_dialog()
@@ -1180,24 +1916,17 @@ class AboutDialog:
         """Center dialog relative to the parent window"""
         self.parent.update_idletasks()
 
-        # Get parent dimensions
-        px, py = self.parent.winfo_x(), self.parent.winfo_y()
-        pw, ph = self.parent.winfo_width(), self.parent.winfo_height()
-
-        # Calculate center position
-        dw, dh = 450, 400
-        x = px + (pw - dw) // 2
-        y = py + (ph - dh) // 2
-
-        self.dialog.geometry(f"{dw}x{dh}+{x}+{y}")
+        # Size and position the dialog in one geometry call
+        dw, dh = map(int, self.DIALOG_SIZE.split("x"))
+        self.dialog.geometry(_center_on(self.parent, dw, dh))
 
     def _setup_layout(self) -> None:
         """Set up the dialog layout efficiently"""
         # Create main container
-        main_frame = tk.Frame(self.dialog, bg=Const.colors['background'])
+        main_frame = tk.Frame(self.dialog, bg=_BG)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
-        content_frame = tk.Frame(main_frame, bg=Const.colors['background'])
+        content_frame = tk.Frame(main_frame, bg=_BG)
         content_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
         # Build layout sections
@@ -1214,25 +1943,25 @@ class AboutDialog:
             parent,
             text="PyCrafter",
             font=("Segoe UI", 16, "bold"),
-            fg=Const.colors['secondary'],
-            bg=Const.colors['background']
+            fg=_SECONDARY,
+            bg=_BG
         ).pack(pady=(0, 5), anchor='center')
 
         # Version badge
-        version_frame = tk.Frame(parent, bg=Const.colors['background_section'], bd=1)
+        version_frame = tk.Frame(parent, bg=_BG_SECTION, bd=1)
         version_frame.pack(pady=(0, 10), anchor='center')
 
         tk.Label(
             version_frame,
             text=f"Version {Const.version}",
             font=("Segoe UI", 10, "bold"),
-            fg=Const.colors['text'],
-            bg=Const.colors['background_section']
+            fg=_TEXT,
+            bg=_BG_SECTION
         ).pack(padx=15, pady=6)
 
     def _create_description(self, parent: tk.Frame) -> None:
         """Create optimized description section"""
-        desc_frame = tk.Frame(parent, bg=Const.colors['background'])
+        desc_frame = tk.Frame(parent, bg=_BG)
         desc_frame.pack(pady=(0, 15), anchor='center')
 
         # Section title
@@ -1240,36 +1969,31 @@ class AboutDialog:
             desc_frame,
             text="Built with:",
             font=("Segoe UI", 10, "bold"),
-            fg=Const.colors['text'],
-            bg=Const.colors['background']
+            fg=_TEXT,
+            bg=_BG
         ).pack(pady=(0, 10))
 
         # Process tool descriptions
-        for tool_desc in Const.description:
-            self._create_tool_entry(desc_frame, tool_desc)
+        for main_desc, url_text in self._PARSED_DESC:
+            self._create_tool_entry(desc_frame, main_desc, url_text)
 
-    def _create_tool_entry(self, parent: tk.Frame, tool_desc: str) -> None:
+    def _create_tool_entry(self, parent: tk.Frame, main_desc: str, url_text: str) -> None:
         """Create individual tool description entry"""
-        lines = tool_desc.strip().split('\n')
-        main_desc = lines[0]
-        url_line = lines[1] if len(lines) > 1 else ""
-
-        tool_frame = tk.Frame(parent, bg=Const.colors['background'])
+        tool_frame = tk.Frame(parent, bg=_BG)
         tool_frame.pack(pady=(5, 15), anchor='center')
 
         # Main description
-        tk.Label(tool_frame, text=main_desc, font=("Segoe UI", 11), fg=Const.colors['text'],
-                 bg=Const.colors['background']).pack()
+        tk.Label(tool_frame, text=main_desc, font=("Segoe UI", 11), fg=_TEXT,
+                 bg=_BG).pack()
 
         # URL if present
-        if url_line:
-            url_text = url_line.replace("Official website: ", "").replace("Official documentation: ", "")
+        if url_text:
             url_label = tk.Label(
                 tool_frame,
                 text=url_text,
                 font=("Segoe UI", 9, "italic"),
-                fg=Const.colors.get('link', '#0066CC'),
-                bg=Const.colors['background'],
+                fg=_LINK,
+                bg=_BG,
                 cursor="hand2"
             )
             url_label.pack(pady=(2, 0))
@@ -1277,7 +2001,7 @@ class AboutDialog:
 
     def _create_action_buttons(self, parent: tk.Frame) -> None:
         """Create optimized action buttons with resized dimensions"""
-        button_frame = tk.Frame(parent, bg=Const.colors['background'])
+        button_frame = tk.Frame(parent, bg=_BG)
         button_frame.pack(pady=(0, 20), anchor='center')
 
         # GitHub button (larger size)
@@ -1285,8 +2009,10 @@ class AboutDialog:
             button_frame,
             text="🔗 GitHub",
             command=lambda: self._open_url(Const.github_repo),
-            bg=Const.colors['secondary'],
+            bg=_SECONDARY,
             fg="white",
+            activebackground=self.HOVER_COLORS['secondary'],
+            activeforeground="white",
             width=8,  # Adjust width (in characters)
             height=25,  # Adjust height (in text lines)
             **self.BUTTON_CONFIG
@@ -1298,8 +2024,10 @@ class AboutDialog:
             button_frame,
             text="Close",
             command=self.close,
-            bg=Const.colors['primary'],
+            bg=_PRIMARY,
             fg="white",
+            activebackground=self.HOVER_COLORS['primary'],
+            activeforeground="white",
             font=("Segoe UI", 11, "bold"),
             relief="flat",
             borderwidth=0,
@@ -1311,9 +2039,8 @@ class AboutDialog:
         )
         close_btn.pack(side='right', pady=0, padx=0)  # Added padx for spacing
 
-        # Store references and setup effects
+        # Store references
         self._widgets.update({'github_btn': github_btn, 'close_btn': close_btn})
-        self._setup_button_effects()
 
     def _create_footer(self) -> None:
         """Create footer with credits"""
@@ -1321,42 +2048,10 @@ class AboutDialog:
             self.dialog,
             text=Const.license,
             font=("Segoe UI", 8),
-            fg=Const.colors['text_lighter'],
-            bg=Const.colors['background']
+            fg=_TEXT_LIGHTER,
+            bg=_BG
         ).pack(side="bottom", pady=(0, 0), anchor='center')
 
-    def _setup_button_effects(self) -> None:
-        """Setup optimized button hover effects"""
-        github_btn = self._widgets['github_btn']
-        close_btn = self._widgets['close_btn']
-
-        # GitHub button effects
-        github_btn.bind("<Enter>", lambda e: self._set_button_color(github_btn, 'secondary', 'hover'))
-        github_btn.bind("<Leave>", lambda e: self._set_button_color(github_btn, 'secondary', 'normal'))
-        github_btn.bind("<Button-1>", lambda e: self._animate_button_click(github_btn, 'secondary'))
-
-        # Close button effects
-        close_btn.bind("<Enter>", lambda e: self._set_button_color(close_btn, 'primary', 'hover'))
-        close_btn.bind("<Leave>", lambda e: self._set_button_color(close_btn, 'primary', 'normal'))
-        close_btn.bind("<Button-1>", lambda e: self._animate_button_click(close_btn, 'primary', callback=self.close))
-
-    def _set_button_color(self, button: tk.Button, color_type: str, state: str) -> None:
-        """Set button color based on state"""
-        if state == 'hover':
-            color = self.HOVER_COLORS.get(color_type, Const.colors[color_type])
-        elif state == 'active':
-            color = self.ACTIVE_COLORS.get(color_type, Const.colors[color_type])
-        else:
-            color = Const.colors[color_type]
-
-        button.config(bg=color)
-
-    def _animate_button_click(self, button: tk.Button, color_type: str, callback=None) -> None:
-        """Animate button click with callback"""
-        self._set_button_color(button, color_type, 'active')
-        delay = 150 if callback else 100
-        self.dialog.after(delay, callback or (lambda: self._set_button_color(button, color_type, 'normal')))
-
     def _setup_events(self) -> None:
         """Setup keyboard and window events"""
         self.dialog.bind("<Escape>", lambda e: self.close())
@@ -1365,21 +2060,14 @@ class AboutDialog:
         self.dialog.focus_set()
 
     def _show_dialog(self) -> None:
-        """Show dialog with fade-in animation"""
-        self.dialog.attributes('-alpha', 0.0)
+        """Show the dialog at full opacity in a single window manager call"""
+        self.dialog.attributes('-alpha', 1.0)
         self.dialog.lift()
 
-        def fade_in(alpha: float = 0.0) -> None:
-            alpha = min(1.0, alpha + 0.1)
-            self.dialog.attributes('-alpha', alpha)
-            if alpha < 1.0 and self.dialog and self.dialog.winfo_exists():
-                self.dialog.after(20, lambda: fade_in(alpha))
-
-        self.dialog.after(10, fade_in)
-
     @staticmethod
     def _open_url(url: str) -> None:
         """Open URL in default browser (avoids repeated imports)."""
+        import webbrowser
 
         try:
             webbrowser.open(url, new=2)  # new=2 opens in new tab if possible